@@ -21,7 +21,6 @@ from datetime import datetime
 from typing import Dict, List, Optional, Union
 
 import cx_Oracle
-import numpy
 
 from airflow.hooks.dbapi import DbApiHook
 
@@ -37,6 +36,19 @@ def _map_param(value):
     return value
 
 
+def _get_bindvar_values(cursor):
+    if cursor.bindvars is None:
+        return
+
+    if isinstance(cursor.bindvars, list):
+        return [v.getvalue() for v in cursor.bindvars]
+
+    if isinstance(cursor.bindvars, dict):
+        return {n: v.getvalue() for (n, v) in cursor.bindvars.items()}
+
+    raise TypeError(f"Unexpected bindvars: {cursor.bindvars!r}")
+
+
 class OracleHook(DbApiHook):
     """
     Interact with Oracle SQL.
@@ -86,18 +98,19 @@ class OracleHook(DbApiHook):
         """
         conn = self.get_connection(self.oracle_conn_id)  # type: ignore[attr-defined]
         conn_config = {'user': conn.login, 'password': conn.password}
-        sid = conn.extra_dejson.get('sid')
-        mod = conn.extra_dejson.get('module')
+        extra = conn.extra_dejson
+        sid = extra.get('sid')
+        mod = extra.get('module')
         schema = conn.schema
 
-        service_name = conn.extra_dejson.get('service_name')
+        service_name = extra.get('service_name')
         port = conn.port if conn.port else 1521
         if conn.host and sid and not service_name:
             conn_config['dsn'] = cx_Oracle.makedsn(conn.host, port, sid)
         elif conn.host and service_name and not sid:
             conn_config['dsn'] = cx_Oracle.makedsn(conn.host, port, service_name=service_name)
         else:
-            dsn = conn.extra_dejson.get('dsn')
+            dsn = extra.get('dsn')
             if dsn is None:
                 dsn = conn.host
                 if conn.port is not None:
@@ -114,21 +127,21 @@ class OracleHook(DbApiHook):
                     dsn += "/" + conn.schema
             conn_config['dsn'] = dsn
 
-        if 'encoding' in conn.extra_dejson:
-            conn_config['encoding'] = conn.extra_dejson.get('encoding')
+        if 'encoding' in extra:
+            conn_config['encoding'] = extra.get('encoding')
             # if `encoding` is specific but `nencoding` is not
             # `nencoding` should use same values as `encoding` to set encoding, inspired by
             # https://github.com/oracle/python-cx_Oracle/issues/157#issuecomment-371877993
-            if 'nencoding' not in conn.extra_dejson:
-                conn_config['nencoding'] = conn.extra_dejson.get('encoding')
-        if 'nencoding' in conn.extra_dejson:
-            conn_config['nencoding'] = conn.extra_dejson.get('nencoding')
-        if 'threaded' in conn.extra_dejson:
-            conn_config['threaded'] = conn.extra_dejson.get('threaded')
-        if 'events' in conn.extra_dejson:
-            conn_config['events'] = conn.extra_dejson.get('events')
-
-        mode = conn.extra_dejson.get('mode', '').lower()
+            if 'nencoding' not in extra:
+                conn_config['nencoding'] = extra.get('encoding')
+        if 'nencoding' in extra:
+            conn_config['nencoding'] = extra.get('nencoding')
+        if 'threaded' in extra:
+            conn_config['threaded'] = extra.get('threaded')
+        if 'events' in extra:
+            conn_config['events'] = extra.get('events')
+
+        mode = extra.get('mode', '').lower()
         if mode == 'sysdba':
             conn_config['mode'] = cx_Oracle.SYSDBA
         elif mode == 'sysasm':
@@ -144,7 +157,7 @@ class OracleHook(DbApiHook):
         elif mode == 'sysrac':
             conn_config['mode'] = cx_Oracle.SYSRAC
 
-        purity = conn.extra_dejson.get('purity', '').lower()
+        purity = extra.get('purity', '').lower()
         if purity == 'new':
             conn_config['purity'] = cx_Oracle.ATTR_PURITY_NEW
         elif purity == 'self':
@@ -192,11 +205,14 @@ class OracleHook(DbApiHook):
             Set 1 to insert each row in each single transaction
         :param replace: Whether to replace instead of insert
         """
+        import numpy
+
         if target_fields:
             target_fields = ', '.join(target_fields)
             target_fields = f'({target_fields})'
         else:
             target_fields = ''
+        sql_prefix = f"INSERT /*+ APPEND */ INTO {table} {target_fields} VALUES"
         conn = self.get_conn()
         if self.supports_autocommit:
             self.set_autocommit(conn, False)
@@ -221,7 +237,7 @@ class OracleHook(DbApiHook):
                 else:
                     lst.append(str(cell))
             values = tuple(lst)
-            sql = f"INSERT /*+ APPEND */ INTO {table} {target_fields} VALUES ({','.join(values)})"
+            sql = f"{sql_prefix} ({','.join(values)})"
             cur.execute(sql)
             if i % commit_every == 0:
                 conn.commit()  # type: ignore[attr-defined]
@@ -314,18 +330,6 @@ class OracleHook(DbApiHook):
 
         sql = f"BEGIN {identifier}({args}); END;"
 
-        def handler(cursor):
-            if cursor.bindvars is None:
-                return
-
-            if isinstance(cursor.bindvars, list):
-                return [v.getvalue() for v in cursor.bindvars]
-
-            if isinstance(cursor.bindvars, dict):
-                return {n: v.getvalue() for (n, v) in cursor.bindvars.items()}
-
-            raise TypeError(f"Unexpected bindvars: {cursor.bindvars!r}")
-
         result = self.run(
             sql,
             autocommit=autocommit,
@@ -334,7 +338,7 @@ class OracleHook(DbApiHook):
                 if isinstance(parameters, dict)
                 else [_map_param(value) for value in parameters]
             ),
-            handler=handler,
+            handler=_get_bindvar_values,
         )
 
         return result